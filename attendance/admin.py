@@ -6,13 +6,24 @@ class AttendanceAdmin(admin.ModelAdmin):
     """Admin interface for attendance records with filtering and search capabilities."""
     list_display = ['employee', 'date', 'status', 'check_in_time', 'check_out_time']
     list_filter = ['status', 'date', 'employee__department']
-    search_fields = ['employee__first_name', 'employee__last_name']
+    # '^' makes the admin emit prefix LIKE 'q%' lookups, which the name
+    # indexes on Employee can serve instead of a full scan.
+    search_fields = ['^employee__first_name', '^employee__last_name']
     ordering = ['-date']
+    list_select_related = ('employee', 'employee__department')
+    autocomplete_fields = ['employee']
+    # Cap rendered rows and skip the unfiltered COUNT(*) per page load.
+    list_per_page = 50
+    show_full_result_count = False
 
 @admin.register(LeaveRequest)
 class LeaveRequestAdmin(admin.ModelAdmin):
     """Admin interface for leave requests with status and type filtering."""
     list_display = ['employee', 'leave_type', 'start_date', 'end_date', 'status']
     list_filter = ['leave_type', 'status', 'start_date']
-    search_fields = ['employee__first_name', 'employee__last_name']
-    ordering = ['-created_at']
\ No newline at end of file
+    search_fields = ['^employee__first_name', '^employee__last_name']
+    ordering = ['-created_at']
+    list_select_related = ('employee',)
+    autocomplete_fields = ['employee']
+    list_per_page = 50
+    show_full_result_count = False
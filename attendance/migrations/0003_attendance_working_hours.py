@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0002_attendance_employee_at_date_f72707_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendance',
+            name='working_hours',
+            field=models.FloatField(default=0, help_text='Total working hours for the day, recomputed on save'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta
+
+from django.db import migrations
+
+
+def backfill_working_hours(apps, schema_editor):
+    """Populates the stored working_hours column for existing records."""
+    Attendance = apps.get_model('attendance', 'Attendance')
+    updated = []
+    for record in Attendance.objects.exclude(
+        check_in_time__isnull=True
+    ).exclude(check_out_time__isnull=True).iterator(chunk_size=2000):
+        check_in = datetime.combine(record.date, record.check_in_time)
+        check_out = datetime.combine(record.date, record.check_out_time)
+        if check_out < check_in:
+            check_out += timedelta(days=1)
+        record.working_hours = (check_out - check_in).total_seconds() / 3600
+        updated.append(record)
+        if len(updated) >= 2000:
+            Attendance.objects.bulk_update(updated, ['working_hours'])
+            updated = []
+    if updated:
+        Attendance.objects.bulk_update(updated, ['working_hours'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0003_attendance_working_hours'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_working_hours, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:04
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0005_alter_attendance_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='attendance',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='leaverequest',
+            options={},
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0006_alter_attendance_options_alter_leaverequest_options'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['date', 'status'], name='employee_at_date_c7626a_idx'),
+        ),
+    ]
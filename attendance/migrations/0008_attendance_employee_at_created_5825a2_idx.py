@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0007_attendance_employee_at_date_c7626a_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['-created_at'], name='employee_at_created_5825a2_idx'),
+        ),
+    ]
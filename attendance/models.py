@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta
+
 from django.db import models
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -10,48 +12,68 @@ class Attendance(models.Model):
     Enforces unique constraint to prevent duplicate records per employee per day.
     
     Attributes:
-        STATUS_CHOICES: Valid attendance status options
+        Status: Valid attendance status options (TextChoices enum)
     """
-    STATUS_CHOICES = [
-        ('PRESENT', 'Present'),
-        ('ABSENT', 'Absent'),
-        ('LATE', 'Late'),
-        ('HALF_DAY', 'Half Day'),
-        ('SICK_LEAVE', 'Sick Leave'),
-        ('VACATION', 'Vacation'),
-        ('HOLIDAY', 'Holiday'),
-    ]
+    class Status(models.TextChoices):
+        PRESENT = 'PRESENT', 'Present'
+        ABSENT = 'ABSENT', 'Absent'
+        LATE = 'LATE', 'Late'
+        HALF_DAY = 'HALF_DAY', 'Half Day'
+        SICK_LEAVE = 'SICK_LEAVE', 'Sick Leave'
+        VACATION = 'VACATION', 'Vacation'
+        HOLIDAY = 'HOLIDAY', 'Holiday'
+
+    # Backward-compatible alias for callers that used the old tuple list.
+    STATUS_CHOICES = Status.choices
+
+    # Columns needed by reporting/analytics scans. Excludes `notes`
+    # (unbounded TextField) so report querysets can use
+    # .only(*Attendance.REPORT_FIELDS) to keep rows narrow.
+    REPORT_FIELDS = ('employee_id', 'date', 'status', 'check_in_time', 'check_out_time')
 
     employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='attendances')
     date = models.DateField(default=timezone.now)
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PRESENT')
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PRESENT)
     check_in_time = models.TimeField(null=True, blank=True, help_text="Time when employee checked in")
     check_out_time = models.TimeField(null=True, blank=True, help_text="Time when employee checked out")
     notes = models.TextField(blank=True, help_text="Additional notes about attendance")
+    working_hours = models.FloatField(
+        default=0,
+        help_text="Total working hours for the day, recomputed on save"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
+        # No default ordering: admin and API viewsets order explicitly, and
+        # a Meta-level default would add ORDER BY to every reverse lookup
+        # and subquery that doesn't need it.
         db_table = 'employee_attendance'
-        ordering = ['-date', 'employee']
-        unique_together = ['employee', 'date']
+        constraints = [
+            models.UniqueConstraint(fields=['employee', 'date'], name='uniq_attendance_employee_date'),
+        ]
+        indexes = [
+            models.Index(fields=['-date']),
+            models.Index(fields=['employee', '-date']),
+            models.Index(fields=['status', 'date']),
+            models.Index(fields=['date', 'status']),
+            models.Index(fields=['-created_at']),
+        ]
 
     def __str__(self):
         """String representation of the attendance record."""
         return f"{self.employee.full_name} - {self.date} ({self.get_status_display()})"
 
-    @property
-    def working_hours(self):
+    def _compute_working_hours(self):
         """Calculates total working hours for the day.
-        
+
         Handles overnight shifts by adding a day to checkout time when
         checkout is before checkin. Returns 0 if either time is missing.
-        
+
         Returns:
             float: Total working hours as decimal (e.g., 8.5 for 8h 30m)
         """
         if self.check_in_time and self.check_out_time:
-            from datetime import datetime, timedelta
             check_in = datetime.combine(self.date, self.check_in_time)
             check_out = datetime.combine(self.date, self.check_out_time)
             if check_out < check_in:
@@ -60,6 +82,15 @@ class Attendance(models.Model):
             return total_time.total_seconds() / 3600
         return 0
 
+    def save(self, *args, **kwargs):
+        """Custom save method keeping the stored working hours up to date.
+
+        The column is denormalized from check_in_time/check_out_time so the
+        read path (serializers, analytics) pays no per-row arithmetic.
+        """
+        self.working_hours = self._compute_working_hours()
+        super().save(*args, **kwargs)
+
 
 class LeaveRequest(models.Model):
     """Leave request model for managing employee time-off applications.
@@ -68,35 +99,41 @@ class LeaveRequest(models.Model):
     Tracks request status from submission through approval/rejection.
     
     Attributes:
-        LEAVE_TYPES: Valid leave type options
-        STATUS_CHOICES: Valid request status options
+        LeaveType: Valid leave type options (TextChoices enum)
+        Status: Valid request status options (TextChoices enum)
     """
-    LEAVE_TYPES = [
-        ('SICK', 'Sick Leave'),
-        ('VACATION', 'Vacation'),
-        ('PERSONAL', 'Personal Leave'),
-        ('EMERGENCY', 'Emergency Leave'),
-    ]
-    
-    STATUS_CHOICES = [
-        ('PENDING', 'Pending'),
-        ('APPROVED', 'Approved'),
-        ('REJECTED', 'Rejected'),
-    ]
+    class LeaveType(models.TextChoices):
+        SICK = 'SICK', 'Sick Leave'
+        VACATION = 'VACATION', 'Vacation'
+        PERSONAL = 'PERSONAL', 'Personal Leave'
+        EMERGENCY = 'EMERGENCY', 'Emergency Leave'
+
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        APPROVED = 'APPROVED', 'Approved'
+        REJECTED = 'REJECTED', 'Rejected'
+
+    # Backward-compatible aliases for callers that used the old tuple lists.
+    LEAVE_TYPES = LeaveType.choices
+    STATUS_CHOICES = Status.choices
 
     employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='leave_requests')
-    leave_type = models.CharField(max_length=20, choices=LEAVE_TYPES)
+    leave_type = models.CharField(max_length=20, choices=LeaveType.choices)
     start_date = models.DateField()
     end_date = models.DateField()
     reason = models.TextField(help_text="Reason for leave request")
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
     approved_by = models.CharField(max_length=100, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'leave_requests'
-        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['employee', 'status', 'start_date', 'end_date']),
+            models.Index(fields=['status', 'start_date']),
+        ]
 
     def __str__(self):
         """String representation of the leave request."""
@@ -1,25 +1,61 @@
+from copy import copy
+from datetime import datetime, timedelta
+
+from django.db import IntegrityError
 from rest_framework import serializers
 from .models import Attendance, LeaveRequest
 
+# Maximum allowed working duration per day (16 hours), in seconds.
+MAX_WORKING_SECONDS = 16 * 3600
+
+# Leave request statuses that block overlapping requests.
+ACTIVE_LEAVE_STATUSES = ('PENDING', 'APPROVED')
+
+# Choice labels resolved once at import time; a plain dict lookup per row is
+# cheaper than Django's get_FOO_display() method dispatch during list
+# serialization.
+ATTENDANCE_STATUS_LABELS = dict(Attendance.STATUS_CHOICES)
+LEAVE_TYPE_LABELS = dict(LeaveRequest.LEAVE_TYPES)
+LEAVE_STATUS_LABELS = dict(LeaveRequest.STATUS_CHOICES)
+
 class AttendanceListSerializer(serializers.ModelSerializer):
-    """Simplified attendance serializer for list views with essential information."""
-    employee_name = serializers.CharField(source='employee.full_name', read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    """Simplified attendance serializer for list views with essential information.
+
+    Expects the queryset to be annotated with `employee_name` (see the
+    viewset) so the name is read off the row with no FK traversal.
+    """
+    employee_name = serializers.CharField(read_only=True)
+    status_display = serializers.SerializerMethodField()
     working_hours = serializers.ReadOnlyField()
-    
+
     class Meta:
         model = Attendance
         fields = [
-            'id', 'employee_name', 'date', 'status_display', 
+            'id', 'employee_name', 'date', 'status_display',
             'check_in_time', 'check_out_time', 'working_hours'
         ]
 
+    def get_status_display(self, obj):
+        """Resolves the status label via the precomputed choice dict."""
+        return ATTENDANCE_STATUS_LABELS.get(obj.status, obj.status)
+
 class AttendanceDetailSerializer(serializers.ModelSerializer):
     """Comprehensive attendance serializer for CRUD operations with validation."""
     employee_name = serializers.CharField(source='employee.full_name', read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    status_display = serializers.SerializerMethodField()
     working_hours = serializers.ReadOnlyField()
-    
+
+    # Field construction walks the model meta on every instantiation; the
+    # bulk_create action builds one serializer per record, so cache the
+    # built fields per class and hand out shallow copies.
+    _fields_cache = None
+
+    def get_fields(self):
+        cls = type(self)
+        if cls._fields_cache is None:
+            cls._fields_cache = super().get_fields()
+        return {name: copy(field) for name, field in cls._fields_cache.items()}
+
     class Meta:
         model = Attendance
         fields = [
@@ -29,6 +65,42 @@ class AttendanceDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at', 'working_hours']
 
+    def get_status_display(self, obj):
+        """Resolves the status label via the precomputed choice dict."""
+        return ATTENDANCE_STATUS_LABELS.get(obj.status, obj.status)
+
+    def create(self, validated_data):
+        """Creates the record, mapping a duplicate (employee, date) to a 400.
+
+        DRF 3.14 only auto-generates a UniqueTogetherValidator from
+        Meta.unique_together, not from UniqueConstraint, so the constraint
+        violation is caught here instead — same pattern as the employee
+        email uniqueness handling, and without a pre-check SELECT.
+        """
+        try:
+            return super().create(validated_data)
+        except IntegrityError as exc:
+            if 'employee' in str(exc) and 'date' in str(exc):
+                raise serializers.ValidationError({
+                    'non_field_errors': [
+                        'Attendance record for this employee and date already exists.'
+                    ]
+                })
+            raise
+
+    def update(self, instance, validated_data):
+        """Updates the record, mapping a duplicate (employee, date) to a 400."""
+        try:
+            return super().update(instance, validated_data)
+        except IntegrityError as exc:
+            if 'employee' in str(exc) and 'date' in str(exc):
+                raise serializers.ValidationError({
+                    'non_field_errors': [
+                        'Attendance record for this employee and date already exists.'
+                    ]
+                })
+            raise
+
     def validate(self, data):
         """Validates attendance data for business rules compliance.
         
@@ -55,53 +127,72 @@ class AttendanceDetailSerializer(serializers.ModelSerializer):
         check_in = data.get('check_in_time')
         check_out = data.get('check_out_time')
         
-        if check_in and check_out and check_out <= check_in:
-            # Allow overnight shifts
-            from datetime import datetime, timedelta
-            date = data.get('date')
-            check_in_datetime = datetime.combine(date, check_in)
-            check_out_datetime = datetime.combine(date, check_out)
-            
-            if check_out_datetime <= check_in_datetime:
-                check_out_datetime += timedelta(days=1)
-                
+        date = data.get('date')
+        if check_in and check_out and date:
+            # Allow overnight shifts: a non-positive duration means checkout
+            # happened on the following day.
+            working_duration = (
+                datetime.combine(date, check_out) - datetime.combine(date, check_in)
+            )
+            if working_duration.total_seconds() <= 0:
+                working_duration += timedelta(days=1)
+
             # Validate reasonable working hours (max 16 hours)
-            working_duration = check_out_datetime - check_in_datetime
-            if working_duration.total_seconds() > 16 * 3600:
+            if working_duration.total_seconds() > MAX_WORKING_SECONDS:
                 raise serializers.ValidationError("Working hours cannot exceed 16 hours per day.")
         
         return data
 
 class LeaveRequestListSerializer(serializers.ModelSerializer):
-    """Simplified leave request serializer for list views."""
-    employee_name = serializers.CharField(source='employee.full_name', read_only=True)
-    leave_type_display = serializers.CharField(source='get_leave_type_display', read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    """Simplified leave request serializer for list views.
+
+    Expects the queryset to be annotated with `employee_name` (see the
+    viewset) so the name is read off the row with no FK traversal.
+    """
+    employee_name = serializers.CharField(read_only=True)
+    leave_type_display = serializers.SerializerMethodField()
+    status_display = serializers.SerializerMethodField()
     duration_days = serializers.ReadOnlyField()
-    
+
     class Meta:
         model = LeaveRequest
         fields = [
-            'id', 'employee_name', 'leave_type_display', 'start_date', 
+            'id', 'employee_name', 'leave_type_display', 'start_date',
             'end_date', 'duration_days', 'status_display', 'created_at'
         ]
 
+    def get_leave_type_display(self, obj):
+        """Resolves the leave type label via the precomputed choice dict."""
+        return LEAVE_TYPE_LABELS.get(obj.leave_type, obj.leave_type)
+
+    def get_status_display(self, obj):
+        """Resolves the status label via the precomputed choice dict."""
+        return LEAVE_STATUS_LABELS.get(obj.status, obj.status)
+
 class LeaveRequestDetailSerializer(serializers.ModelSerializer):
     """Comprehensive leave request serializer with overlap detection validation."""
     employee_name = serializers.CharField(source='employee.full_name', read_only=True)
-    leave_type_display = serializers.CharField(source='get_leave_type_display', read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    leave_type_display = serializers.SerializerMethodField()
+    status_display = serializers.SerializerMethodField()
     duration_days = serializers.ReadOnlyField()
-    
+
     class Meta:
         model = LeaveRequest
         fields = [
             'id', 'employee', 'employee_name', 'leave_type', 'leave_type_display',
-            'start_date', 'end_date', 'duration_days', 'reason', 'status', 
+            'start_date', 'end_date', 'duration_days', 'reason', 'status',
             'status_display', 'approved_by', 'created_at', 'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at', 'duration_days']
 
+    def get_leave_type_display(self, obj):
+        """Resolves the leave type label via the precomputed choice dict."""
+        return LEAVE_TYPE_LABELS.get(obj.leave_type, obj.leave_type)
+
+    def get_status_display(self, obj):
+        """Resolves the status label via the precomputed choice dict."""
+        return LEAVE_STATUS_LABELS.get(obj.status, obj.status)
+
     def validate(self, data):
         """Validates leave request data for business rules compliance.
         
@@ -131,18 +222,38 @@ class LeaveRequestDetailSerializer(serializers.ModelSerializer):
         if start_date and end_date and end_date < start_date:
             raise serializers.ValidationError("End date cannot be before start date.")
             
-        # Check for overlapping leave requests
+        # On update with employee and dates unchanged, the overlap query is
+        # skipped — but only when the write cannot move the row into an
+        # active status. Reactivating a rejected request (REJECTED ->
+        # PENDING/APPROVED) must re-check, because other requests may have
+        # legally claimed the window while this one was inactive.
+        if (
+            self.instance
+            and employee
+            and self.instance.employee_id == employee.pk
+            and self.instance.start_date == start_date
+            and self.instance.end_date == end_date
+            and (
+                self.instance.status in ACTIVE_LEAVE_STATUSES
+                or data.get('status', self.instance.status) not in ACTIVE_LEAVE_STATUSES
+            )
+        ):
+            return data
+
         if employee and start_date and end_date:
+            # Filter on employee_id and restrict to the pk column so the
+            # EXISTS probe stays on the composite index instead of
+            # materializing full rows.
             overlapping_requests = LeaveRequest.objects.filter(
-                employee=employee,
-                status__in=['PENDING', 'APPROVED'],
+                employee_id=employee.pk,
+                status__in=ACTIVE_LEAVE_STATUSES,
                 start_date__lte=end_date,
                 end_date__gte=start_date
-            )
-            
+            ).only('pk')
+
             if self.instance:
                 overlapping_requests = overlapping_requests.exclude(pk=self.instance.pk)
-                
+
             if overlapping_requests.exists():
                 raise serializers.ValidationError(
                     "Employee already has a leave request for overlapping dates."
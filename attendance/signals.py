@@ -0,0 +1,37 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Attendance
+
+# How long analytics payloads stay cached (seconds).
+ANALYTICS_CACHE_TIMEOUT = 300
+
+# Generation counter folded into every analytics cache key. Bumping it on
+# writes invalidates all cached payloads at once without needing backend
+# support for pattern deletes.
+ANALYTICS_GENERATION_KEY = 'attendance:analytics:generation'
+
+
+def analytics_cache_key(year, month):
+    """Builds the cache key for one (year, month) analytics payload."""
+    generation = cache.get(ANALYTICS_GENERATION_KEY, 0)
+    return f'attendance:analytics:{generation}:{year}:{month}'
+
+
+def bump_analytics_generation():
+    """Invalidates every cached analytics payload by bumping the generation.
+
+    Called by the signal receivers below, and directly by write paths that
+    bypass signals (bulk_create in the viewset and the seeder).
+    """
+    try:
+        cache.incr(ANALYTICS_GENERATION_KEY)
+    except ValueError:
+        cache.set(ANALYTICS_GENERATION_KEY, 1, None)
+
+
+@receiver([post_save, post_delete], sender=Attendance)
+def invalidate_analytics_cache(sender, **kwargs):
+    """Invalidates cached analytics whenever attendance data changes."""
+    bump_analytics_generation()
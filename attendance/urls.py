@@ -1,17 +1,14 @@
-from django.urls import path, include
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 from . import views
-from employees.views import AttendanceListView
 
 # 创建路由器
 router = DefaultRouter()
 router.register(r'attendance', views.AttendanceViewSet)
 router.register(r'leave-requests', views.LeaveRequestViewSet)
 
+# Mounted under the shared 'api/' prefix in employee_project.urls.
 urlpatterns = [
-    path('api/', include(router.urls)),
     # 修复：分析API应该在router外面
-    path('api/attendance-analytics/', views.AttendanceAnalyticsView.as_view(), name='attendance-analytics'),
-    # 模板视图
-    path('attendance/', AttendanceListView.as_view(), name='attendance_list'),
-]
\ No newline at end of file
+    path('attendance-analytics/', views.AttendanceAnalyticsView.as_view(), name='attendance-analytics'),
+] + router.urls
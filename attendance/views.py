@@ -1,21 +1,90 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django_filters.rest_framework import DjangoFilterBackend
+import django_filters
+from employee_project.filters import LazyDjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Avg, Count, Q, Value
+from django.db.models.functions import Concat, TruncMonth
 from django.utils import timezone
 from datetime import timedelta, date
-from collections import defaultdict
 import calendar
 
+# calendar.month_name resolves names through the locale on every lookup;
+# snapshot it once at import time.
+MONTH_NAMES = tuple(calendar.month_name)
+
+from django.core.cache import cache
+
+from employees.models import Employee
 from .models import Attendance, LeaveRequest
+from .signals import ANALYTICS_CACHE_TIMEOUT, analytics_cache_key, bump_analytics_generation
 from .serializers import (
     AttendanceListSerializer, AttendanceDetailSerializer,
     LeaveRequestListSerializer, LeaveRequestDetailSerializer
 )
 
+def month_range(year, month):
+    """Returns the [start, next_start) date range covering one month.
+
+    Range predicates keep the date column bare so the planner can use the
+    date indexes, unlike date__month/date__year which wrap it in EXTRACT().
+
+    Raises:
+        ValidationError: If year/month don't form a valid calendar month
+    """
+    try:
+        year, month = int(year), int(month)
+        start = date(year, month, 1)
+        end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    except (TypeError, ValueError):
+        raise ValidationError({'month': ['month and year must form a valid calendar month.']})
+    return start, end
+
+def year_range(year):
+    """Returns the [start, next_start) date range covering one year.
+
+    Raises:
+        ValidationError: If the year isn't a valid calendar year
+    """
+    try:
+        year = int(year)
+        return date(year, 1, 1), date(year + 1, 1, 1)
+    except (TypeError, ValueError):
+        raise ValidationError({'year': ['Enter a valid year.']})
+
+
+class AttendanceFilter(django_filters.FilterSet):
+    """Declared filterset for attendance so the filter backend handles
+    date_from/date_to/month/year instead of manual query-param parsing in
+    get_queryset. Month/year use the sargable range helpers."""
+    date_from = django_filters.DateFilter(field_name='date', lookup_expr='gte')
+    date_to = django_filters.DateFilter(field_name='date', lookup_expr='lte')
+    month = django_filters.NumberFilter(method='filter_month')
+    year = django_filters.NumberFilter(method='filter_year')
+
+    class Meta:
+        model = Attendance
+        fields = ['employee', 'status', 'employee__department']
+
+    def filter_month(self, queryset, name, value):
+        """Filters to one month; needs the year parameter alongside."""
+        year = self.data.get('year')
+        if not year:
+            return queryset
+        start, end = month_range(year, value)
+        return queryset.filter(date__gte=start, date__lt=end)
+
+    def filter_year(self, queryset, name, value):
+        """Filters to one year unless month already narrowed the range."""
+        if self.data.get('month'):
+            return queryset
+        start, end = year_range(value)
+        return queryset.filter(date__gte=start, date__lt=end)
+
 class AttendanceViewSet(viewsets.ModelViewSet):
     """Attendance management ViewSet with advanced filtering and bulk operations.
     
@@ -25,10 +94,14 @@ class AttendanceViewSet(viewsets.ModelViewSet):
     - Individual employee attendance summaries
     - Dynamic serializer selection
     """
-    queryset = Attendance.objects.select_related('employee').all()
-    
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['employee', 'status', 'employee__department']
+    # Annotate the employee name in SQL so list serialization reads it
+    # straight off the row instead of walking the FK per record.
+    queryset = Attendance.objects.select_related('employee').annotate(
+        employee_name=Concat('employee__first_name', Value(' '), 'employee__last_name')
+    )
+
+    filter_backends = [LazyDjangoFilterBackend, SearchFilter, OrderingFilter]
+    filterset_class = AttendanceFilter
     search_fields = ['employee__first_name', 'employee__last_name', 'notes']
     ordering_fields = ['date', 'check_in_time']
     ordering = ['-date']
@@ -39,37 +112,6 @@ class AttendanceViewSet(viewsets.ModelViewSet):
             return AttendanceListSerializer
         return AttendanceDetailSerializer
 
-    def get_queryset(self):
-        """Returns filtered queryset supporting date range and monthly filtering.
-        
-        Query Parameters:
-            date_from: Filter records on or after this date
-            date_to: Filter records on or before this date
-            month: Filter records for specific month (1-12)
-            year: Filter records for specific year
-        """
-        queryset = Attendance.objects.select_related('employee').all()
-        
-        # Date range filtering
-        date_from = self.request.query_params.get('date_from')
-        date_to = self.request.query_params.get('date_to')
-        
-        if date_from:
-            queryset = queryset.filter(date__gte=date_from)
-        if date_to:
-            queryset = queryset.filter(date__lte=date_to)
-        
-        # Monthly filtering
-        month = self.request.query_params.get('month')
-        year = self.request.query_params.get('year')
-        
-        if month and year:
-            queryset = queryset.filter(date__month=month, date__year=year)
-        elif year:
-            queryset = queryset.filter(date__year=year)
-            
-        return queryset
-
     @action(detail=False, methods=['post'])
     def bulk_create(self, request):
         """Creates multiple attendance records in a single request.
@@ -84,26 +126,64 @@ class AttendanceViewSet(viewsets.ModelViewSet):
             Response with creation summary and error details
         """
         attendance_records = request.data.get('attendance_records', [])
-        
+
         if not attendance_records:
             return Response(
                 {'error': 'No attendance records provided'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        
-        created_records = []
+
+        # Validate everything first, then insert the valid rows in batches
+        # instead of one INSERT per record.
+        candidates = []
         errors = []
-        
+
         for record_data in attendance_records:
             serializer = AttendanceDetailSerializer(data=record_data)
             if serializer.is_valid():
-                created_records.append(serializer.save())
+                instance = Attendance(**serializer.validated_data)
+                # bulk_create bypasses save(), so fill the stored column here
+                instance.working_hours = instance._compute_working_hours()
+                candidates.append((record_data, instance))
             else:
                 errors.append({
                     'data': record_data,
                     'errors': serializer.errors
                 })
-        
+
+        # One SELECT for all existing (employee, date) pairs instead of a
+        # per-record uniqueness probe.
+        existing_pairs = set()
+        if candidates:
+            existing_pairs = set(Attendance.objects.filter(
+                employee_id__in={inst.employee_id for _, inst in candidates},
+                date__in={inst.date for _, inst in candidates},
+            ).values_list('employee_id', 'date'))
+
+        instances = []
+        seen_pairs = set()
+        for record_data, instance in candidates:
+            pair = (instance.employee_id, instance.date)
+            if pair in existing_pairs or pair in seen_pairs:
+                errors.append({
+                    'data': record_data,
+                    'errors': {
+                        'non_field_errors': [
+                            'Attendance record for this employee and date already exists.'
+                        ]
+                    }
+                })
+            else:
+                seen_pairs.add(pair)
+                instances.append(instance)
+
+        with transaction.atomic():
+            created_records = Attendance.objects.bulk_create(instances, batch_size=1000)
+
+        # bulk_create bypasses post_save, so drop the cached analytics here.
+        if created_records:
+            bump_analytics_generation()
+
         return Response({
             'created_count': len(created_records),
             'error_count': len(errors),
@@ -137,45 +217,45 @@ class AttendanceViewSet(viewsets.ModelViewSet):
             )
         
         queryset = Attendance.objects.filter(employee_id=employee_id)
-        
+
         if month and year:
-            queryset = queryset.filter(date__month=month, date__year=year)
+            start, end = month_range(year, month)
+            queryset = queryset.filter(date__gte=start, date__lt=end)
         elif year:
-            queryset = queryset.filter(date__year=year)
-        
-        # Calculate statistics
-        total_days = queryset.count()
-        present_days = queryset.filter(status__in=['PRESENT', 'LATE']).count()
-        absent_days = queryset.filter(status='ABSENT').count()
-        late_days = queryset.filter(status='LATE').count()
-        
-        attendance_rate = (present_days / total_days * 100) if total_days > 0 else 0
-        
-        # Calculate average working hours
-        working_records = queryset.exclude(
-            Q(check_in_time__isnull=True) | Q(check_out_time__isnull=True)
-        )
-        
-        total_working_hours = sum(record.working_hours for record in working_records)
-        average_working_hours = (
-            total_working_hours / working_records.count()
-            if working_records.count() > 0 else 0
+            start, end = year_range(year)
+            queryset = queryset.filter(date__gte=start, date__lt=end)
+
+        # Calculate all statistics with a single aggregate query
+        stats = queryset.aggregate(
+            total_days=Count('id'),
+            present_days=Count('id', filter=Q(status__in=['PRESENT', 'LATE'])),
+            absent_days=Count('id', filter=Q(status='ABSENT')),
+            late_days=Count('id', filter=Q(status='LATE')),
+            average_working_hours=Avg(
+                'working_hours',
+                filter=Q(check_in_time__isnull=False, check_out_time__isnull=False)
+            ),
         )
-        
-        # Get employee name
-        employee_name = "Unknown"
-        if queryset.exists():
-            employee_name = queryset.first().employee.full_name
-        
+
+        total_days = stats['total_days']
+        attendance_rate = (stats['present_days'] / total_days * 100) if total_days > 0 else 0
+
+        # Fetch the name directly from Employee instead of materializing a
+        # full attendance row just for the FK join
+        name_parts = Employee.objects.filter(pk=employee_id).values_list(
+            'first_name', 'last_name'
+        ).first()
+        employee_name = f"{name_parts[0]} {name_parts[1]}" if name_parts else "Unknown"
+
         return Response({
             'employee_name': employee_name,
             'period': f"{month}/{year}" if month and year else str(year) if year else "All time",
             'total_days': total_days,
-            'present_days': present_days,
-            'absent_days': absent_days,
-            'late_days': late_days,
+            'present_days': stats['present_days'],
+            'absent_days': stats['absent_days'],
+            'late_days': stats['late_days'],
             'attendance_rate': round(attendance_rate, 2),
-            'average_working_hours': round(average_working_hours, 2)
+            'average_working_hours': round(stats['average_working_hours'] or 0, 2)
         })
 
 class LeaveRequestViewSet(viewsets.ModelViewSet):
@@ -189,7 +269,7 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
     """
     queryset = LeaveRequest.objects.select_related('employee').all()
     
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [LazyDjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['employee', 'leave_type', 'status', 'employee__department']
     search_fields = ['employee__first_name', 'employee__last_name', 'reason']
     ordering_fields = ['created_at', 'start_date', 'end_date']
@@ -208,7 +288,9 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
             date_from: Filter requests starting on or after this date
             date_to: Filter requests ending on or before this date
         """
-        queryset = LeaveRequest.objects.select_related('employee').all()
+        queryset = LeaveRequest.objects.select_related('employee').annotate(
+            employee_name=Concat('employee__first_name', Value(' '), 'employee__last_name')
+        )
         
         date_from = self.request.query_params.get('date_from')
         date_to = self.request.query_params.get('date_to')
@@ -231,18 +313,23 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
         Returns:
             Response with success message and updated request data
         """
+        # get_object first so a missing pk is a 404, not a "not pending"
+        # 400. The status-guarded UPDATE below stays race-safe against
+        # concurrent approvals and writes only the changed columns.
         leave_request = self.get_object()
-        
-        if leave_request.status != 'PENDING':
+        updated = LeaveRequest.objects.filter(pk=leave_request.pk, status='PENDING').update(
+            status='APPROVED',
+            approved_by=request.data.get('approved_by', 'System'),
+            updated_at=timezone.now(),
+        )
+
+        if not updated:
             return Response(
                 {'error': 'Only pending leave requests can be approved'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        
-        leave_request.status = 'APPROVED'
-        leave_request.approved_by = request.data.get('approved_by', 'System')
-        leave_request.save()
-        
+
+        leave_request.refresh_from_db(fields=['status', 'approved_by', 'updated_at'])
         serializer = self.get_serializer(leave_request)
         return Response({
             'message': 'Leave request approved successfully',
@@ -261,17 +348,19 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
             Response with success message and updated request data
         """
         leave_request = self.get_object()
-        
-        if leave_request.status != 'PENDING':
+        updated = LeaveRequest.objects.filter(pk=leave_request.pk, status='PENDING').update(
+            status='REJECTED',
+            approved_by=request.data.get('approved_by', 'System'),
+            updated_at=timezone.now(),
+        )
+
+        if not updated:
             return Response(
                 {'error': 'Only pending leave requests can be rejected'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        
-        leave_request.status = 'REJECTED'
-        leave_request.approved_by = request.data.get('approved_by', 'System')
-        leave_request.save()
-        
+
+        leave_request.refresh_from_db(fields=['status', 'approved_by', 'updated_at'])
         serializer = self.get_serializer(leave_request)
         return Response({
             'message': 'Leave request rejected',
@@ -280,66 +369,65 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
 
 class AttendanceAnalyticsView(APIView):
     """Attendance analytics API providing comprehensive statistical insights."""
-    
+
     def get(self, request):
-        """Returns comprehensive attendance analytics data."""
+        """Returns comprehensive attendance analytics data.
+
+        The payload only changes when attendance records change, so it is
+        cached per (year, month) with a short TTL. Saves and deletes
+        invalidate the whole family of keys via signals, and the bulk
+        insert paths (the bulk_create action, the seeder) bump the
+        generation explicitly since bulk_create skips post_save
+        (see signals.py).
+        """
         month = request.query_params.get('month')
         year = request.query_params.get('year', timezone.now().year)
-        
-        queryset = Attendance.objects.select_related('employee__department')
-        
+
+        cache_key = analytics_cache_key(year, month)
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._build_analytics(month, year)
+            cache.set(cache_key, data, ANALYTICS_CACHE_TIMEOUT)
+
+        return Response(data)
+
+    def _build_analytics(self, month, year):
+        """Computes the analytics payload with the aggregate queries."""
+        queryset = Attendance.objects.all()
+
         if month and year:
-            queryset = queryset.filter(date__month=month, date__year=year)
+            range_start, range_end = month_range(year, month)
+            queryset = queryset.filter(date__gte=range_start, date__lt=range_end)
         elif year:
-            queryset = queryset.filter(date__year=year)
-        
-        # Monthly overview - 生成最近6个月的数据
-        monthly_data = defaultdict(lambda: {'present': 0, 'absent': 0, 'late': 0})
-        
-        # 获取最近6个月
-        end_date = timezone.now().date()
-        start_date = end_date - timedelta(days=180)
-        
-        # 按月份统计实际数据
-        for record in queryset.filter(date__gte=start_date):
-            month_name = calendar.month_name[record.date.month]
-            if record.status == 'PRESENT':
-                monthly_data[month_name]['present'] += 1
-            elif record.status == 'ABSENT':
-                monthly_data[month_name]['absent'] += 1
-            elif record.status == 'LATE':
-                monthly_data[month_name]['late'] += 1
-        
-        # 确保所有月份都有数据（即使是0）
-        current_date = start_date
-        while current_date <= end_date:
-            month_name = calendar.month_name[current_date.month]
-            if month_name not in monthly_data:
-                monthly_data[month_name] = {'present': 0, 'absent': 0, 'late': 0}
-            current_date = current_date.replace(day=1)
-            # 移动到下个月
-            if current_date.month == 12:
-                current_date = current_date.replace(year=current_date.year + 1, month=1)
-            else:
-                current_date = current_date.replace(month=current_date.month + 1)
-        
-        monthly_overview = []
-        
-        # 按时间顺序排列最近6个月
-        for i in range(6):
-            target_date = end_date - timedelta(days=30 * i)
-            month_name = calendar.month_name[target_date.month]
-            if month_name in monthly_data:
-                monthly_overview.append({
-                    'month': month_name,
-                    'present': monthly_data[month_name]['present'],
-                    'absent': monthly_data[month_name]['absent'],
-                    'late': monthly_data[month_name]['late']
-                })
-        
-        # 反转顺序，让最早的月份在前面
-        monthly_overview.reverse()
-        
+            range_start, range_end = year_range(year)
+            queryset = queryset.filter(date__gte=range_start, date__lt=range_end)
+
+        # Monthly overview - 最近6个月的数据
+        # One TruncMonth GROUP BY, ordered oldest-first; no Python fill
+        # loops or 30-day month approximations.
+        start_date = timezone.now().date() - timedelta(days=180)
+
+        monthly_rows = (
+            queryset.filter(date__gte=start_date)
+            .annotate(month_start=TruncMonth('date'))
+            .values('month_start')
+            .annotate(
+                present=Count('id', filter=Q(status='PRESENT')),
+                absent=Count('id', filter=Q(status='ABSENT')),
+                late=Count('id', filter=Q(status='LATE')),
+            )
+            .order_by('month_start')
+        )
+        monthly_overview = [
+            {
+                'month': MONTH_NAMES[row['month_start'].month],
+                'present': row['present'],
+                'absent': row['absent'],
+                'late': row['late'],
+            }
+            for row in monthly_rows
+        ]
+
         # 其余代码保持不变...
         status_counts = queryset.values('status').annotate(count=Count('id')).order_by('-count')
         attendance_by_status = [
@@ -347,43 +435,32 @@ class AttendanceAnalyticsView(APIView):
             for item in status_counts
         ]
         
-        # Department-wise attendance rates
-        dept_stats = {}
-        for record in queryset:
-            dept_name = record.employee.department.name
-            if dept_name not in dept_stats:
-                dept_stats[dept_name] = {'total': 0, 'present': 0}
-            
-            dept_stats[dept_name]['total'] += 1
-            if record.status in ['PRESENT', 'LATE']:
-                dept_stats[dept_name]['present'] += 1
-        
+        # Department-wise attendance rates, grouped in the database
+        dept_agg = queryset.values('employee__department__name').annotate(
+            total=Count('id'),
+            present=Count('id', filter=Q(status__in=['PRESENT', 'LATE'])),
+        )
+
         department_wise_attendance = [
             {
-                'department': dept_name,
+                'department': row['employee__department__name'],
                 'attendance_rate': round(
-                    (stats['present'] / stats['total'] * 100) if stats['total'] > 0 else 0, 2
+                    (row['present'] / row['total'] * 100) if row['total'] > 0 else 0, 2
                 )
             }
-            for dept_name, stats in dept_stats.items()
+            for row in dept_agg
         ]
-        
-        # Average working hours calculation
-        working_records = queryset.exclude(
+
+        # Average working hours from the stored column, computed in SQL
+        average_working_hours = queryset.exclude(
             Q(check_in_time__isnull=True) | Q(check_out_time__isnull=True)
-        )
-        
-        total_working_hours = sum(record.working_hours for record in working_records)
-        average_working_hours = (
-            total_working_hours / working_records.count()
-            if working_records.count() > 0 else 0
-        )
-        
-        return Response({
+        ).aggregate(avg=Avg('working_hours'))['avg'] or 0
+
+        return {
             'period': f"{month}/{year}" if month else str(year),
             'total_records': queryset.count(),
             'monthly_overview': monthly_overview,
             'attendance_by_status': attendance_by_status,
             'department_wise_attendance': department_wise_attendance,
             'average_working_hours': round(average_working_hours, 2)
-        })
\ No newline at end of file
+        }
\ No newline at end of file
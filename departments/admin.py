@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count, Q
 from .models import Department
 
 @admin.register(Department)
@@ -13,15 +14,23 @@ class DepartmentAdmin(admin.ModelAdmin):
     search_fields = ['name', 'description']
     ordering = ['name']
     readonly_fields = ['created_at', 'updated_at']
-    
+
+    def get_queryset(self, request):
+        """Annotates active employee counts so the changelist runs one
+        GROUP BY query instead of a COUNT per row."""
+        return super().get_queryset(request).annotate(
+            _employee_count=Count('employees', filter=Q(employees__is_active=True))
+        )
+
     def employee_count(self, obj):
         """Returns the number of active employees in the department.
-        
+
         Args:
             obj: Department instance
-            
+
         Returns:
             int: Count of active employees
         """
-        return obj.employee_count
-    employee_count.short_description = 'Employees'
\ No newline at end of file
+        return obj._employee_count
+    employee_count.short_description = 'Employees'
+    employee_count.admin_order_field = '_employee_count'
\ No newline at end of file
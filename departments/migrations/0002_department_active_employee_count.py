@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='department',
+            name='active_employee_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, help_text='Denormalized count of active employees, maintained by signals'),
+        ),
+    ]
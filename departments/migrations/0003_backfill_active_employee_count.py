@@ -0,0 +1,27 @@
+from django.db import migrations
+from django.db.models import Count, Q
+
+
+def backfill_active_employee_count(apps, schema_editor):
+    """Populates the denormalized counter from the current employee table."""
+    Department = apps.get_model('departments', 'Department')
+    departments = list(
+        Department.objects.annotate(
+            _count=Count('employees', filter=Q(employees__is_active=True))
+        )
+    )
+    for department in departments:
+        department.active_employee_count = department._count
+    Department.objects.bulk_update(departments, ['active_employee_count'], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0002_department_active_employee_count'),
+        ('employees', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_active_employee_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0003_backfill_active_employee_count'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='department',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
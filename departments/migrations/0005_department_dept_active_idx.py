@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0004_alter_department_created_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_active'], name='dept_active_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:23
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0005_department_dept_active_idx'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='department',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='uniq_department_name_ci'),
+        ),
+    ]
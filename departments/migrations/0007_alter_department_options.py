@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:25
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0006_department_uniq_department_name_ci'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='department',
+            options={'verbose_name': 'Department', 'verbose_name_plural': 'Departments'},
+        ),
+    ]
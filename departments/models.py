@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Lower
 from django.core.validators import MinLengthValidator
 
 class Department(models.Model):
@@ -18,37 +20,71 @@ class Department(models.Model):
         null=True,
         help_text="Optional description of the department"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(
         default=True,
         help_text="Whether this department is currently active"
     )
+    active_employee_count = models.PositiveIntegerField(
+        default=0,
+        db_index=True,
+        help_text="Denormalized count of active employees, maintained by signals"
+    )
 
     class Meta:
+        # No default ordering: the API viewset and the admin both order by
+        # name explicitly, and a Meta-level default would append ORDER BY
+        # to every relation access and single-row lookup as well.
         db_table = 'departments'
-        ordering = ['name']
         verbose_name = 'Department'
         verbose_name_plural = 'Departments'
+        indexes = [
+            # Partial index: only active rows are indexed, which is what
+            # the is_active=True filter on the list endpoint walks.
+            models.Index(fields=['is_active'], condition=Q(is_active=True), name='dept_active_idx'),
+        ]
+        constraints = [
+            # Case variations of the same name collide at the DB level,
+            # so no pre-check SELECT is needed before inserts.
+            models.UniqueConstraint(Lower('name'), name='uniq_department_name_ci'),
+        ]
 
     def __str__(self):
         """String representation of the department."""
         return self.name
 
-    @property
-    def employee_count(self):
-        """Returns the number of active employees in this department.
-        
-        Returns:
-            int: Count of active employees assigned to this department
-        """
-        return self.employees.filter(is_active=True).count()
+    # Fields checked by save() when deciding whether anything changed.
+    TRACKED_FIELDS = ('name', 'description', 'is_active')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Snapshots loaded values so save() can detect no-op writes."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
 
     def save(self, *args, **kwargs):
         """Custom save method to format department name to title case.
-        
-        Strips whitespace and converts name to title case before saving.
+
+        Strips whitespace and converts name to title case before saving,
+        but only when the name is actually part of the write. Skips the
+        UPDATE entirely when nothing tracked has changed, so repeated
+        saves (e.g. bulk admin imports) don't rewrite the row and churn
+        updated_at.
         """
-        if self.name:
+        update_fields = kwargs.get('update_fields')
+        if self.name and (update_fields is None or 'name' in update_fields):
             self.name = self.name.strip().title()
-        super().save(*args, **kwargs)
\ No newline at end of file
+
+        loaded = getattr(self, '_loaded_values', None)
+        if (
+            self.pk
+            and loaded is not None
+            and not kwargs.get('force_insert')
+            and all(getattr(self, field) == loaded.get(field) for field in self.TRACKED_FIELDS)
+        ):
+            return
+
+        super().save(*args, **kwargs)
+        self._loaded_values = {field: getattr(self, field) for field in self.TRACKED_FIELDS}
\ No newline at end of file
@@ -1,8 +1,11 @@
+from django.db import IntegrityError
 from rest_framework import serializers
 from .models import Department
 
 class DepartmentSerializer(serializers.ModelSerializer):
-    employee_count = serializers.ReadOnlyField()
+    # Reads the denormalized counter column, so no join or aggregate is
+    # needed to report how many active employees a department has.
+    employee_count = serializers.IntegerField(source='active_employee_count', read_only=True)
     
     class Meta:
         model = Department
@@ -15,4 +18,38 @@ class DepartmentSerializer(serializers.ModelSerializer):
         """
         if len(value.strip()) < 2:
             raise serializers.ValidationError("Department name must be at least 2 characters long.")
-        return value.strip().title()
\ No newline at end of file
+        return value.strip().title()
+
+    def create(self, validated_data):
+        """Creates the department, mapping a duplicate name to a field error.
+
+        Name uniqueness lives in the case-insensitive DB constraint
+        (uniq_department_name_ci), so the violation is caught here instead
+        of pre-checked with a SELECT.
+        """
+        try:
+            return super().create(validated_data)
+        except IntegrityError as exc:
+            if 'name' in str(exc):
+                raise serializers.ValidationError({'name': ['Department with this name already exists.']})
+            raise
+
+    def update(self, instance, validated_data):
+        """Updates the department, mapping a duplicate name to a field error."""
+        try:
+            return super().update(instance, validated_data)
+        except IntegrityError as exc:
+            if 'name' in str(exc):
+                raise serializers.ValidationError({'name': ['Department with this name already exists.']})
+            raise
+
+
+class DepartmentListSerializer(DepartmentSerializer):
+    """Read-only projection for list responses.
+
+    Omits description (an unbounded TextField) so list rows stay narrow;
+    the detail endpoint still returns the full record.
+    """
+
+    class Meta(DepartmentSerializer.Meta):
+        fields = ['id', 'name', 'is_active', 'employee_count', 'created_at', 'updated_at']
\ No newline at end of file
@@ -0,0 +1,49 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Department
+
+
+def _shift_count(department_id, delta):
+    """Applies an atomic delta to a department's cached active-employee count.
+
+    Uses an F-expression UPDATE so concurrent saves cannot race each other
+    into a stale value.
+    """
+    if department_id and delta:
+        Department.objects.filter(pk=department_id).update(
+            active_employee_count=F('active_employee_count') + delta
+        )
+
+
+@receiver(pre_save, sender='employees.Employee')
+def snapshot_employee_counter_state(sender, instance, **kwargs):
+    """Remembers the persisted (department, is_active) pair before a save."""
+    if instance.pk:
+        instance._counter_state = sender.objects.filter(pk=instance.pk).values_list(
+            'department_id', 'is_active'
+        ).first()
+    else:
+        instance._counter_state = None
+
+
+@receiver(post_save, sender='employees.Employee')
+def sync_counter_on_employee_save(sender, instance, created, **kwargs):
+    """Adjusts department counters after an employee is created or updated."""
+    old_department_id, was_active = getattr(instance, '_counter_state', None) or (None, False)
+    if old_department_id == instance.department_id:
+        _shift_count(instance.department_id, int(instance.is_active) - int(was_active))
+    else:
+        if was_active:
+            _shift_count(old_department_id, -1)
+        if instance.is_active:
+            _shift_count(instance.department_id, 1)
+    instance._counter_state = (instance.department_id, instance.is_active)
+
+
+@receiver(post_delete, sender='employees.Employee')
+def sync_counter_on_employee_delete(sender, instance, **kwargs):
+    """Decrements the department counter when an active employee is deleted."""
+    if instance.is_active:
+        _shift_count(instance.department_id, -1)
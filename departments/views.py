@@ -1,11 +1,21 @@
+import django_filters
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django_filters.rest_framework import DjangoFilterBackend
+from employee_project.filters import LazyDjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 
 from .models import Department
-from .serializers import DepartmentSerializer
+from .serializers import DepartmentListSerializer, DepartmentSerializer
+
+
+class DepartmentFilter(django_filters.FilterSet):
+    """Declared once at import time; filterset_fields would rebuild an
+    equivalent class through model introspection on every request."""
+
+    class Meta:
+        model = Department
+        fields = ['is_active']
 
 
 class DepartmentViewSet(viewsets.ModelViewSet):
@@ -13,12 +23,30 @@ class DepartmentViewSet(viewsets.ModelViewSet):
     ViewSet for managing departments
     Provides CRUD operations: Create, Read, Update, Delete
     """
+    # The serializer reads the denormalized active_employee_count column,
+    # so no annotation or per-row COUNT is needed here.
     queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Skip description (TextField) — the list serializer doesn't
+            # return it, so don't fetch it.
+            return queryset.only(
+                'id', 'name', 'is_active', 'active_employee_count',
+                'created_at', 'updated_at',
+            )
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return DepartmentListSerializer
+        return super().get_serializer_class()
     
     # 添加过滤、搜索、排序功能
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['is_active']  # 可以按是否激活过滤
+    filter_backends = [LazyDjangoFilterBackend, SearchFilter, OrderingFilter]
+    filterset_class = DepartmentFilter  # 可以按是否激活过滤
     search_fields = ['name', 'description']  # 可以搜索名称和描述
     ordering_fields = ['name', 'created_at']  # 可以按名称或创建时间排序
     ordering = ['name']  # 默认按名称排序
@@ -31,7 +59,8 @@ class DepartmentViewSet(viewsets.ModelViewSet):
         """
         department = self.get_object()
         department.is_active = True
-        department.save()
+        # Only the toggled column (plus updated_at) is written.
+        department.save(update_fields=['is_active', 'updated_at'])
         
         serializer = self.get_serializer(department)
         return Response({
@@ -47,16 +76,18 @@ class DepartmentViewSet(viewsets.ModelViewSet):
         """
         department = self.get_object()
         
-        # 检查是否有活跃员工
-        active_employees = department.employees.filter(is_active=True).count()
-        if active_employees > 0:
+        # 检查是否有活跃员工 — a single-row EXISTS probe, always current even
+        # if bulk writes bypassed the counter signals; the COUNT for the
+        # error message is only paid on the failure branch.
+        if department.employees.filter(is_active=True).exists():
+            active_employees = department.employees.filter(is_active=True).count()
             return Response(
                 {'error': f'Cannot deactivate department. It has {active_employees} active employees.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
         department.is_active = False
-        department.save()
+        department.save(update_fields=['is_active', 'updated_at'])
         
         serializer = self.get_serializer(department)
         return Response({
@@ -0,0 +1,21 @@
+from django_filters.rest_framework import DjangoFilterBackend
+
+
+class LazyDjangoFilterBackend(DjangoFilterBackend):
+    """DjangoFilterBackend that skips filterset work on unfiltered requests.
+
+    Instantiating and validating a FilterSet (form construction included)
+    costs real CPU on every list request even when no filter parameters
+    were sent. This backend peeks at the query string first and only
+    hands off to django-filter when at least one declared filter name is
+    actually present.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        """Filters the queryset only when a declared filter param is sent."""
+        filterset_class = self.get_filterset_class(view, queryset)
+        if filterset_class is None or not any(
+            name in request.query_params for name in filterset_class.base_filters
+        ):
+            return queryset
+        return super().filter_queryset(request, queryset, view)
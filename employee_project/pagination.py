@@ -0,0 +1,28 @@
+from rest_framework.pagination import CursorPagination
+
+
+class DefaultCursorPagination(CursorPagination):
+    """Cursor pagination keyed on the indexed created_at column.
+
+    PageNumberPagination compiles to LIMIT/OFFSET, so fetching page N scans
+    and discards all rows of the first N-1 pages. A cursor encodes the last
+    row seen and turns every page into an index range scan, making deep
+    pages cost the same as the first one.
+
+    Views that expose an OrderingFilter ordering keep it — CursorPagination
+    picks that up automatically — otherwise newest-first is used.
+    """
+    page_size = 20
+    ordering = '-created_at'
+
+
+class EmployeeCursorPagination(DefaultCursorPagination):
+    """Cursor pagination for the employee list, keyed on the name index.
+
+    Employees are browsed alphabetically, so the cursor follows the
+    (first_name, last_name, id) composite index rather than created_at.
+    The id tiebreaker makes the key unique — duplicate names would
+    otherwise let rows slip between pages.
+    """
+    page_size = 50
+    ordering = ('first_name', 'last_name', 'id')
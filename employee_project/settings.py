@@ -39,6 +39,7 @@ INSTALLED_APPS = [
     'corsheaders',            # Cross-Origin Resource Sharing support
     
     # Local applications - Employee Management System modules
+    'employee_project',       # Project-level config (DB connection tuning)
     'departments',            # Department management functionality
     'employees',              # Employee and performance management
     'attendance',             # Attendance and leave request management
@@ -81,6 +82,18 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Persistent connections: reuse one connection per worker instead
+        # of opening a fresh one on every request.
+        'CONN_MAX_AGE': 60,
+    }
+}
+
+# Cache Configuration
+# Backs the Swagger schema cache and the attendance analytics cache.
+# Swap for Redis/Memcached in production so workers share entries.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
 
@@ -117,47 +130,6 @@ STATICFILES_DIRS = [
 # Default Primary Key Field Type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
-# REST Framework Configuration
-# Default settings for API functionality
-REST_FRAMEWORK = {
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
-    'PAGE_SIZE': 20,
-    'DEFAULT_FILTER_BACKENDS': [
-        'django_filters.rest_framework.DjangoFilterBackend',
-        'rest_framework.filters.SearchFilter',
-        'rest_framework.filters.OrderingFilter',
-    ],
-    'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
-    ],
-}
-
-# Swagger/OpenAPI Documentation Settings
-SWAGGER_SETTINGS = {
-    'SECURITY_DEFINITIONS': {
-        'Basic': {
-            'type': 'basic'
-        },
-        'Bearer': {
-            'type': 'apiKey',
-            'name': 'Authorization',
-            'in': 'header'
-        }
-    },
-    'USE_SESSION_AUTH': True,
-    'JSON_EDITOR': True,
-    'SUPPORTED_SUBMIT_METHODS': [
-        'get',
-        'post',
-        'put',
-        'delete',
-        'patch'
-    ],
-}
-
-# 在文件末尾添加以下配置
-
 # Authentication Configuration
 AUTHENTICATION_BACKENDS = [
     'django.contrib.auth.backends.ModelBackend',
@@ -181,17 +153,16 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',  # 临时使用默认权限
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'employee_project.pagination.DefaultCursorPagination',
     'PAGE_SIZE': 20,
-    'DEFAULT_FILTER_BACKENDS': [
-        'django_filters.rest_framework.DjangoFilterBackend',
-        'rest_framework.filters.SearchFilter',
-        'rest_framework.filters.OrderingFilter',
-    ],
+    # No DEFAULT_FILTER_BACKENDS: every viewset declares its own
+    # filter_backends list, so a global default would only be a second,
+    # shadowed registration of the same backends.
+    # The browsable API re-renders serializer HTML forms (including FK
+    # dropdown querysets) on every response, so it is debug-only.
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
-    ],
+    ] + (['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
 }
 # Add Token Authentication to Swagger
 SWAGGER_SETTINGS = {
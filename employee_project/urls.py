@@ -1,17 +1,25 @@
 from django.contrib import admin
 from django.urls import path, include
-from django.http import JsonResponse
+from django.http import HttpResponse
+from django.views.decorators.cache import cache_page, never_cache
+from django.views.decorators.http import require_GET
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
-from employees.views import DashboardView
+from employees import auth_views
+from employees.views import (
+    AttendanceListView,
+    DashboardView,
+    DepartmentListView,
+    EmployeeListView,
+)
 
-# 健康检查视图
+# 健康检查视图 — probed constantly by load balancers, so it allocates
+# nothing: an empty 204 instead of a serialized JSON body.
+@never_cache
+@require_GET
 def health_check(request):
-    return JsonResponse({
-        'status': 'healthy',
-        'message': 'Employee Management System is running'
-    })
+    return HttpResponse(status=204)
 
 # Swagger配置
 schema_view = get_schema_view(
@@ -26,23 +34,38 @@ schema_view = get_schema_view(
 )
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
-    
-    # 健康检查
+    # 健康检查 — first so probes match on the first resolver entry
     path('health/', health_check, name='health-check'),
+
+    path('admin/', admin.site.urls),
+
+    # Dashboard页面 — static shells that fetch data client-side, so the
+    # rendered HTML is cached for five minutes.
+    path('dashboard/', cache_page(300)(DashboardView.as_view()), name='dashboard'),
     
-    # Dashboard页面
-    path('dashboard/', DashboardView.as_view(), name='dashboard'),
-    
-    # API endpoints
-    path('', include('departments.urls')),
-    path('', include('employees.urls')),
-    path('', include('attendance.urls')),
-    
-    # API Documentation
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
-    
+    # API endpoints — one shared prefix, so the resolver only descends
+    # into the app URLconfs for paths that actually start with api/.
+    path('api/', include('departments.urls')),
+    path('api/', include('employees.urls')),
+    path('api/', include('attendance.urls')),
+
+    # Template views (previously duplicated across the app URLconfs)
+    path('departments/', cache_page(300)(DepartmentListView.as_view()), name='department_list'),
+    path('employees/', cache_page(300)(EmployeeListView.as_view()), name='employee_list'),
+    path('attendance/', cache_page(300)(AttendanceListView.as_view()), name='attendance_list'),
+
+    # Authentication views
+    path('login/', auth_views.login_view, name='login'),
+    path('logout/', auth_views.logout_view, name='logout'),
+    path('register/', auth_views.register_view, name='register'),
+
+
+    # API Documentation — the schema is expensive to build (walks every
+    # URL pattern and serializer), so cache it for an hour.
+    path('swagger/', schema_view.with_ui('swagger', cache_timeout=3600), name='schema-swagger-ui'),
+    path('swagger.json', schema_view.without_ui(cache_timeout=3600), name='schema-json'),
+    path('redoc/', schema_view.with_ui('redoc', cache_timeout=3600), name='schema-redoc'),
+
     # 默认跳转到API文档
-    path('', schema_view.with_ui('swagger', cache_timeout=0), name='api-docs'),
+    path('', schema_view.with_ui('swagger', cache_timeout=3600), name='api-docs'),
 ]
\ No newline at end of file
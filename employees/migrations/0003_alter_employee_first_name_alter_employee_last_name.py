@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0002_userprofile'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='employee',
+            name='first_name',
+            field=models.CharField(db_index=True, max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='employee',
+            name='last_name',
+            field=models.CharField(db_index=True, max_length=50),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0004_alter_employee_created_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['department'], name='emp_active_dept_idx'),
+        ),
+    ]
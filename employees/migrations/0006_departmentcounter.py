@@ -0,0 +1,26 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0007_alter_department_options'),
+        ('employees', '0005_employee_emp_active_dept_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DepartmentCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('next_id', models.PositiveIntegerField(default=1)),
+                ('department', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='employee_counter', to='departments.department')),
+            ],
+            options={
+                'db_table': 'department_counters',
+            },
+        ),
+    ]
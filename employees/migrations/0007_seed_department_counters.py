@@ -0,0 +1,26 @@
+from django.db import migrations
+from django.db.models import Count
+
+
+def seed_department_counters(apps, schema_editor):
+    """Starts each department's counter after its current employee count."""
+    Department = apps.get_model('departments', 'Department')
+    DepartmentCounter = apps.get_model('employees', 'DepartmentCounter')
+    counts = dict(
+        Department.objects.annotate(_count=Count('employees')).values_list('pk', '_count')
+    )
+    DepartmentCounter.objects.bulk_create([
+        DepartmentCounter(department_id=dept_id, next_id=count + 1)
+        for dept_id, count in counts.items()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0006_departmentcounter'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_department_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:36
+
+from django.db import migrations, models
+import employees.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0007_seed_department_counters'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='employee',
+            name='phone_number',
+            field=models.CharField(help_text='Phone number in international format', max_length=17, validators=[employees.models.validate_phone_number]),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0008_alter_employee_phone_number'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['first_name', 'last_name', 'id'], name='emp_name_cursor_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-08-27 08:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0009_employee_emp_name_cursor_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='employee',
+            name='emp_active_dept_idx',
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['department'], include=('salary',), name='emp_active_dept_idx'),
+        ),
+    ]
@@ -1,8 +1,64 @@
-from django.db import models
-from django.core.validators import RegexValidator, EmailValidator, MinValueValidator, MaxValueValidator
+import re
+
+from django.db import models, transaction
+from django.core.exceptions import ValidationError
+from django.core.validators import EmailValidator, MinValueValidator, MaxValueValidator
 from django.utils import timezone
 from departments.models import Department
 
+# Compiled once at import time; validation on the serializer hot path
+# just runs the match.
+_PHONE_RE = re.compile(r'^\+?1?\d{9,15}\Z')
+
+# Single shared instance instead of one per field definition.
+email_validator = EmailValidator()
+
+
+def validate_phone_number(value):
+    """Validates international phone-number format.
+
+    Raises:
+        ValidationError: If the value doesn't match the expected format
+    """
+    if not _PHONE_RE.match(value):
+        raise ValidationError(
+            "Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed."
+        )
+
+
+class DepartmentCounter(models.Model):
+    """Monotonic per-department sequence backing employee-ID generation.
+
+    Employee.save() used to run COUNT(*) over the employees table for
+    every insert; reserving IDs from this counter row costs one locked
+    single-row read plus an UPDATE, and never reuses a suffix after
+    deletes.
+    """
+    department = models.OneToOneField(
+        Department,
+        on_delete=models.CASCADE,
+        related_name='employee_counter'
+    )
+    next_id = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        db_table = 'department_counters'
+
+    def __str__(self):
+        """String representation of the counter."""
+        return f"{self.department.name}: {self.next_id}"
+
+    @classmethod
+    def next_value(cls, department):
+        """Atomically reserves the next employee-ID suffix for a department."""
+        with transaction.atomic():
+            counter, _ = cls.objects.select_for_update().get_or_create(department=department)
+            value = counter.next_id
+            counter.next_id = value + 1
+            counter.save(update_fields=['next_id'])
+        return value
+
+
 class Employee(models.Model):
     """Employee model storing comprehensive employee information.
     
@@ -28,15 +84,11 @@ class Employee(models.Model):
     ]
 
     # Personal Information
-    first_name = models.CharField(max_length=50)
-    last_name = models.CharField(max_length=50)
-    email = models.EmailField(unique=True, validators=[EmailValidator()])
-    phone_regex = RegexValidator(
-        regex=r'^\+?1?\d{9,15}$',
-        message="Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed."
-    )
+    first_name = models.CharField(max_length=50, db_index=True)
+    last_name = models.CharField(max_length=50, db_index=True)
+    email = models.EmailField(unique=True, validators=[email_validator])
     phone_number = models.CharField(
-        validators=[phone_regex],
+        validators=[validate_phone_number],
         max_length=17,
         help_text="Phone number in international format"
     )
@@ -72,7 +124,7 @@ class Employee(models.Model):
     
     # System fields
     is_active = models.BooleanField(default=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -80,6 +132,22 @@ class Employee(models.Model):
         ordering = ['first_name', 'last_name']
         verbose_name = 'Employee'
         verbose_name_plural = 'Employees'
+        indexes = [
+            # Partial index over active employees keyed by department: the
+            # deactivate guard and the employee-count resync both probe
+            # department_id with is_active=True. salary rides along so the
+            # analytics per-department aggregate can run as an index-only
+            # scan on Postgres (INCLUDE is a no-op elsewhere).
+            models.Index(
+                fields=['department'],
+                include=['salary'],
+                condition=models.Q(is_active=True),
+                name='emp_active_dept_idx',
+            ),
+            # Composite index backing the list cursor: each page is a range
+            # scan continuing from (first_name, last_name, id).
+            models.Index(fields=['first_name', 'last_name', 'id'], name='emp_name_cursor_idx'),
+        ]
 
     def __str__(self):
         """String representation of the employee."""
@@ -97,10 +165,10 @@ class Employee(models.Model):
         Formats first and last names to title case.
         """
         if not self.employee_id:
-            # Generate employee ID based on department
+            # Generate employee ID from the department's counter row
             dept_code = self.department.name[:3].upper() if self.department else "EMP"
-            count = Employee.objects.filter(department=self.department).count() + 1
-            self.employee_id = f"{dept_code}{count:04d}"
+            suffix = DepartmentCounter.next_value(self.department)
+            self.employee_id = f"{dept_code}{suffix:04d}"
         
         if self.first_name:
             self.first_name = self.first_name.strip().title()
@@ -185,12 +253,16 @@ class UserProfile(models.Model):
         """Returns user's full name."""
         return f"{self.user.first_name} {self.user.last_name}".strip() or self.user.username
 
+    # Built once at import time; has_permission used to rebuild this
+    # dict-of-lists on every call.
+    ROLE_PERMISSIONS = {
+        'ADMIN': frozenset(['view_all', 'edit_all', 'delete_all', 'manage_users']),
+        'HR': frozenset(['view_all', 'edit_employees', 'manage_attendance', 'view_reports']),
+        'MANAGER': frozenset(['view_team', 'edit_team', 'approve_leave']),
+        'EMPLOYEE': frozenset(['view_own', 'edit_own', 'request_leave']),
+    }
+    _EMPTY_PERMS = frozenset()
+
     def has_permission(self, permission):
         """Check if user has specific permission based on role."""
-        permissions = {
-            'ADMIN': ['view_all', 'edit_all', 'delete_all', 'manage_users'],
-            'HR': ['view_all', 'edit_employees', 'manage_attendance', 'view_reports'],
-            'MANAGER': ['view_team', 'edit_team', 'approve_leave'],
-            'EMPLOYEE': ['view_own', 'edit_own', 'request_leave'],
-        }
-        return permission in permissions.get(self.role, [])
\ No newline at end of file
+        return permission in self.ROLE_PERMISSIONS.get(self.role, self._EMPTY_PERMS)
\ No newline at end of file
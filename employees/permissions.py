@@ -1,70 +1,96 @@
 from rest_framework import permissions
 
+from .models import UserProfile
+
+# Per-view role grants. Flattened below into a frozenset for O(1)
+# membership tests in the per-request hot path.
+VIEW_PERMISSIONS = {
+    'EmployeeViewSet': {
+        'ADMIN': ['list', 'create', 'retrieve', 'update', 'destroy'],
+        'HR': ['list', 'create', 'retrieve', 'update'],
+        'MANAGER': ['list', 'retrieve', 'update'],
+        'EMPLOYEE': ['list', 'retrieve'],
+    },
+    'DepartmentViewSet': {
+        'ADMIN': ['list', 'create', 'retrieve', 'update', 'destroy'],
+        'HR': ['list', 'retrieve'],
+        'MANAGER': ['list', 'retrieve'],
+        'EMPLOYEE': ['list', 'retrieve'],
+    },
+    'AttendanceViewSet': {
+        'ADMIN': ['list', 'create', 'retrieve', 'update', 'destroy'],
+        'HR': ['list', 'create', 'retrieve', 'update'],
+        'MANAGER': ['list', 'retrieve'],
+        'EMPLOYEE': ['list', 'create', 'retrieve'],
+    },
+}
+
+_PERM_TABLE = frozenset(
+    (view_name, role, action)
+    for view_name, roles in VIEW_PERMISSIONS.items()
+    for role, actions in roles.items()
+    for action in actions
+)
+
+
+def get_user_profile(request):
+    """Returns the requesting user's profile, fetched at most once per request.
+
+    Permission checks run several times per request (view-level, then
+    object-level); this caches the profile — including a miss, stored as
+    None — on the user object so the lookup costs a single SELECT. The
+    related employee row is joined in so own-record comparisons need no
+    follow-up query.
+    """
+    user = request.user
+    if not hasattr(user, '_cached_profile'):
+        user._cached_profile = (
+            UserProfile.objects.select_related('employee').filter(user=user).first()
+        )
+    return user._cached_profile
+
+
 class RoleBasedPermission(permissions.BasePermission):
     """Custom permission class for role-based access control."""
-    
+
     def has_permission(self, request, view):
         """Check if user has permission to access the view."""
         if not request.user.is_authenticated:
             return False
-        
+
         # Superuser has all permissions
         if request.user.is_superuser:
             return True
-        
+
         # Check if user has profile
-        if not hasattr(request.user, 'profile'):
+        profile = get_user_profile(request)
+        if profile is None:
             return False
-        
-        user_role = request.user.profile.role
-        
-        # Define view permissions
-        view_permissions = {
-            'EmployeeViewSet': {
-                'ADMIN': ['list', 'create', 'retrieve', 'update', 'destroy'],
-                'HR': ['list', 'create', 'retrieve', 'update'],
-                'MANAGER': ['list', 'retrieve', 'update'],
-                'EMPLOYEE': ['list', 'retrieve'],
-            },
-            'DepartmentViewSet': {
-                'ADMIN': ['list', 'create', 'retrieve', 'update', 'destroy'],
-                'HR': ['list', 'retrieve'],
-                'MANAGER': ['list', 'retrieve'],
-                'EMPLOYEE': ['list', 'retrieve'],
-            },
-            'AttendanceViewSet': {
-                'ADMIN': ['list', 'create', 'retrieve', 'update', 'destroy'],
-                'HR': ['list', 'create', 'retrieve', 'update'],
-                'MANAGER': ['list', 'retrieve'],
-                'EMPLOYEE': ['list', 'create', 'retrieve'],
-            }
-        }
-        
-        view_name = view.__class__.__name__
-        allowed_actions = view_permissions.get(view_name, {}).get(user_role, [])
-        
-        return view.action in allowed_actions
+
+        return (view.__class__.__name__, profile.role, view.action) in _PERM_TABLE
 
     def has_object_permission(self, request, view, obj):
         """Check if user has permission to access specific object."""
         if not request.user.is_authenticated:
             return False
-        
+
         if request.user.is_superuser:
             return True
-        
-        if not hasattr(request.user, 'profile'):
+
+        profile = get_user_profile(request)
+        if profile is None:
             return False
-        
-        user_role = request.user.profile.role
-        
-        # Employees can only access their own records
-        if user_role == 'EMPLOYEE':
-            if hasattr(obj, 'employee'):
-                return obj.employee.user_profile.user == request.user
-            elif hasattr(obj, 'user'):
-                return obj.user == request.user
-        
+
+        # Employees can only access their own records. The class-level
+        # hasattr probe avoids triggering a relation fetch, and comparing
+        # FK ids against the cached profile avoids the old
+        # obj.employee.user_profile.user chain (two SELECTs per object).
+        if profile.role == 'EMPLOYEE':
+            if hasattr(type(obj), 'employee'):
+                return obj.employee_id is not None and obj.employee_id == profile.employee_id
+            elif hasattr(type(obj), 'user'):
+                return obj.user_id == request.user.pk
+
         return True
 
 
@@ -75,19 +101,24 @@ from functools import wraps
 
 def role_required(allowed_roles):
     """Decorator to check if user has required role."""
+    # Frozen at decoration time so each request does a hashed lookup
+    # instead of scanning a list.
+    allowed_roles = frozenset(allowed_roles)
+
     def decorator(view_func):
         @wraps(view_func)
         @login_required
         def wrapped_view(request, *args, **kwargs):
             if request.user.is_superuser:
                 return view_func(request, *args, **kwargs)
-            
-            if not hasattr(request.user, 'profile'):
+
+            profile = get_user_profile(request)
+            if profile is None:
                 raise PermissionDenied("User profile not found")
-            
-            if request.user.profile.role not in allowed_roles:
+
+            if profile.role not in allowed_roles:
                 raise PermissionDenied("Insufficient permissions")
-            
+
             return view_func(request, *args, **kwargs)
         return wrapped_view
     return decorator
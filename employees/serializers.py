@@ -1,7 +1,12 @@
+from django.db import IntegrityError
 from rest_framework import serializers
 from .models import Employee, Performance
 from departments.serializers import DepartmentSerializer
 
+# Label map resolved once at import; get_rating_display() would walk
+# RATING_CHOICES per row on list endpoints.
+RATING_LABELS = dict(Performance.RATING_CHOICES)
+
 class EmployeeListSerializer(serializers.ModelSerializer):
     """Simplified employee serializer for list views.
     
@@ -36,22 +41,29 @@ class EmployeeDetailSerializer(serializers.ModelSerializer):
             'is_active', 'created_at', 'updated_at'
         ]
         read_only_fields = ['employee_id', 'created_at', 'updated_at']
+        extra_kwargs = {
+            # The DB unique index enforces this; dropping the implicit
+            # UniqueValidator saves a pre-check SELECT on every write.
+            'email': {'validators': []},
+        }
 
-    def validate_email(self, value):
-        """Validates email uniqueness across all employees.
-        
-        Args:
-            value: Email address to validate
-            
-        Returns:
-            Validated email address
-            
-        Raises:
-            ValidationError: If email already exists for another employee
-        """
-        if Employee.objects.filter(email=value).exclude(pk=self.instance.pk if self.instance else None).exists():
-            raise serializers.ValidationError("Employee with this email already exists.")
-        return value
+    def create(self, validated_data):
+        """Creates the employee, mapping a duplicate email to a field error."""
+        try:
+            return super().create(validated_data)
+        except IntegrityError as exc:
+            if 'email' in str(exc):
+                raise serializers.ValidationError({'email': ['Employee with this email already exists.']})
+            raise
+
+    def update(self, instance, validated_data):
+        """Updates the employee, mapping a duplicate email to a field error."""
+        try:
+            return super().update(instance, validated_data)
+        except IntegrityError as exc:
+            if 'email' in str(exc):
+                raise serializers.ValidationError({'email': ['Employee with this email already exists.']})
+            raise
 
     def validate_salary(self, value):
         """Validates salary is non-negative.
@@ -71,8 +83,8 @@ class EmployeeDetailSerializer(serializers.ModelSerializer):
 
 class PerformanceSerializer(serializers.ModelSerializer):
     """Performance review serializer with employee information and validation."""
-    employee_name = serializers.CharField(source='employee.full_name', read_only=True)
-    rating_display = serializers.CharField(source='get_rating_display', read_only=True)
+    employee_name = serializers.SerializerMethodField()
+    rating_display = serializers.SerializerMethodField()
     
     class Meta:
         model = Performance
@@ -82,6 +94,21 @@ class PerformanceSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
+    def get_employee_name(self, obj):
+        """Returns the employee's full name, preferring the SQL annotation.
+
+        List querysets annotate employee_full_name via Concat so no
+        Employee row is hydrated per review; instances from other paths
+        (create responses, prefetched profile reviews) fall back to the
+        model property.
+        """
+        name = getattr(obj, 'employee_full_name', None)
+        return name if name is not None else obj.employee.full_name
+
+    def get_rating_display(self, obj):
+        """Returns the rating label from the precomputed map."""
+        return RATING_LABELS.get(obj.rating)
+
     def validate_rating(self, value):
         """Validates rating is within acceptable range (1-5).
         
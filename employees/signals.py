@@ -0,0 +1,20 @@
+"""Cache invalidation for the analytics endpoint.
+
+The analytics payload is cached for up to a minute; these receivers drop
+it whenever an employee or performance row changes so the dashboard
+never serves data older than the last write.
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+ANALYTICS_CACHE_KEY = 'emp_analytics_v1'
+
+
+@receiver(post_save, sender='employees.Employee')
+@receiver(post_delete, sender='employees.Employee')
+@receiver(post_save, sender='employees.Performance')
+@receiver(post_delete, sender='employees.Performance')
+def invalidate_analytics_cache(sender, **kwargs):
+    """Drops the cached analytics payload after any relevant write."""
+    cache.delete(ANALYTICS_CACHE_KEY)
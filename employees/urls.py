@@ -1,4 +1,4 @@
-from django.urls import path, include
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 from . import views, auth_views
 
@@ -7,17 +7,8 @@ router.register(r'employees', views.EmployeeViewSet)
 router.register(r'performance', views.PerformanceViewSet)
 router.register(r'auth', auth_views.AuthViewSet, basename='auth')
 
+# Mounted under the shared 'api/' prefix in employee_project.urls;
+# template and login views live in the project URLconf.
 urlpatterns = [
-    path('api/', include(router.urls)),
-    path('api/analytics/', views.EmployeeAnalyticsView.as_view(), name='employee-analytics'),
-    
-    # Template views
-    path('employees/', views.EmployeeListView.as_view(), name='employee_list'),
-    path('departments/', views.DepartmentListView.as_view(), name='department_list'),
-    path('attendance/', views.AttendanceListView.as_view(), name='attendance_list'),
-    
-    # Authentication views
-    path('login/', auth_views.login_view, name='login'),
-    path('logout/', auth_views.logout_view, name='logout'),
-    path('register/', auth_views.register_view, name='register'),
-]
\ No newline at end of file
+    path('analytics/', views.EmployeeAnalyticsView.as_view(), name='employee-analytics'),
+] + router.urls
@@ -1,15 +1,50 @@
+import django_filters
+from django.core.cache import cache
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django_filters.rest_framework import DjangoFilterBackend
+from employee_project.filters import LazyDjangoFilterBackend
+from employee_project.pagination import EmployeeCursorPagination
 from rest_framework.filters import SearchFilter, OrderingFilter
-from django.db.models import Count, Avg
+from django.db.models import Count, Avg, Q, Value
+from django.db.models.functions import Concat
 
 from rest_framework.permissions import IsAuthenticated
 
 from .models import Employee, Performance
-from .serializers import EmployeeListSerializer, EmployeeDetailSerializer, PerformanceSerializer
+from .serializers import (
+    RATING_LABELS,
+    EmployeeListSerializer,
+    EmployeeDetailSerializer,
+    PerformanceSerializer,
+)
+from .signals import ANALYTICS_CACHE_KEY
+
+
+class EmployeeFilter(django_filters.FilterSet):
+    """Filter schema for employees, built once at import time.
+
+    date_from/date_to bound the joining date, replacing the manual
+    query-param parsing that used to live in get_queryset.
+    """
+    date_from = django_filters.DateFilter(field_name='date_joined', lookup_expr='gte')
+    date_to = django_filters.DateFilter(field_name='date_joined', lookup_expr='lte')
+
+    class Meta:
+        model = Employee
+        fields = ['department', 'employment_status', 'is_active', 'gender']
+
+
+class PerformanceFilter(django_filters.FilterSet):
+    """Filter schema for performance reviews, built once at import time."""
+    date_from = django_filters.DateFilter(field_name='review_date', lookup_expr='gte')
+    date_to = django_filters.DateFilter(field_name='review_date', lookup_expr='lte')
+
+    class Meta:
+        model = Performance
+        fields = ['employee', 'rating', 'employee__department']
+
 
 class EmployeeViewSet(viewsets.ModelViewSet):
     """Employee management ViewSet providing CRUD operations and custom actions.
@@ -24,15 +59,26 @@ class EmployeeViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]  # 暂时简化权限
     
     # Filter, search, and ordering configuration
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['department', 'employment_status', 'is_active', 'gender']
+    filter_backends = [LazyDjangoFilterBackend, SearchFilter, OrderingFilter]
+    filterset_class = EmployeeFilter
     search_fields = ['first_name', 'last_name', 'email', 'employee_id', 'position']
     ordering_fields = ['first_name', 'last_name', 'date_joined', 'salary']
-    ordering = ['first_name', 'last_name']
+    # id tiebreaker keeps the cursor key unique across duplicate names.
+    ordering = ['first_name', 'last_name', 'id']
+    pagination_class = EmployeeCursorPagination
+
+    # Columns fetched for list responses. date_joined and salary are not
+    # rendered but must be present for cursor pagination when the client
+    # orders by them.
+    LIST_VALUES = (
+        'id', 'employee_id', 'first_name', 'last_name', 'email',
+        'department__name', 'position', 'employment_status',
+        'date_joined', 'salary',
+    )
 
     def get_serializer_class(self):
         """Returns appropriate serializer based on action type.
-        
+
         Returns:
             EmployeeListSerializer for list actions
             EmployeeDetailSerializer for all other actions
@@ -42,25 +88,53 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         return EmployeeDetailSerializer
 
     def get_queryset(self):
-        """Returns filtered queryset supporting date range filtering.
-        
-        Query Parameters:
-            date_from: Filter employees joined on or after this date
-            date_to: Filter employees joined on or before this date
+        """Returns the base queryset, tuned per action.
+
+        Deleting needs only the employee row itself; every other action
+        serializes the nested department, so the join pays for itself
+        there. The profile action additionally annotates the attendance
+        totals so get_object returns them in the same query.
         """
-        queryset = Employee.objects.select_related('department').all()
-        
-        # Filter by joining date range
-        date_from = self.request.query_params.get('date_from')
-        date_to = self.request.query_params.get('date_to')
-        
-        if date_from:
-            queryset = queryset.filter(date_joined__gte=date_from)
-        if date_to:
-            queryset = queryset.filter(date_joined__lte=date_to)
-            
+        if self.action == 'destroy':
+            # Nothing is serialized on delete, so the TEXT column can stay
+            # in the database.
+            return Employee.objects.defer('address')
+        queryset = super().get_queryset()
+        if self.action == 'profile':
+            queryset = queryset.annotate(
+                total_attendance=Count('attendances'),
+                present_attendance=Count(
+                    'attendances', filter=Q(attendances__status__in=['PRESENT', 'LATE'])
+                ),
+            )
         return queryset
 
+    @staticmethod
+    def _render_list_row(row):
+        """Builds one list-response dict from a values() row."""
+        return {
+            'id': row['id'],
+            'employee_id': row['employee_id'],
+            'full_name': f"{row['first_name']} {row['last_name']}",
+            'email': row['email'],
+            'department_name': row['department__name'],
+            'position': row['position'],
+            'employment_status': row['employment_status'],
+        }
+
+    def list(self, request, *args, **kwargs):
+        """Lists employees straight from values() rows.
+
+        The list projection is simple enough that DRF's per-row field
+        machinery costs more than the query; serializing dicts keeps the
+        shape of EmployeeListSerializer at a fraction of the CPU.
+        """
+        rows = self.filter_queryset(self.get_queryset()).values(*self.LIST_VALUES)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response([self._render_list_row(row) for row in page])
+        return Response([self._render_list_row(row) for row in rows])
+
     @action(detail=True, methods=['post'])
     def activate(self, request, pk=None):
         """Activates an employee by setting status to active.
@@ -75,7 +149,9 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         employee = self.get_object()
         employee.is_active = True
         employee.employment_status = 'ACTIVE'
-        employee.save()
+        # update_fields keeps the UPDATE to the changed columns while still
+        # firing the signals that maintain the department counter.
+        employee.save(update_fields=['is_active', 'employment_status', 'updated_at'])
         
         serializer = self.get_serializer(employee)
         return Response({
@@ -97,7 +173,7 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         employee = self.get_object()
         employee.is_active = False
         employee.employment_status = 'INACTIVE'
-        employee.save()
+        employee.save(update_fields=['is_active', 'employment_status', 'updated_at'])
         
         serializer = self.get_serializer(employee)
         return Response({
@@ -122,18 +198,38 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             Response containing employee profile data
         """
         employee = self.get_object()
-        
-        # Get recent performance reviews
-        recent_performances = employee.performances.all()[:5]
-        
-        # Calculate attendance statistics
-        total_attendance = employee.attendances.count()
-        present_days = employee.attendances.filter(status__in=['PRESENT', 'LATE']).count()
+
+        # Recent reviews rendered straight from values() rows in the shape
+        # of PerformanceSerializer — no Performance instances are built,
+        # and the owning employee's name is already in hand.
+        recent_performances = [
+            {
+                'id': row['id'],
+                'employee': employee.pk,
+                'employee_name': employee.full_name,
+                'rating': row['rating'],
+                'rating_display': RATING_LABELS.get(row['rating']),
+                'review_date': row['review_date'],
+                'reviewer': row['reviewer'],
+                'comments': row['comments'],
+                'created_at': row['created_at'],
+                'updated_at': row['updated_at'],
+            }
+            for row in employee.performances.order_by('-review_date').values(
+                'id', 'rating', 'review_date', 'reviewer', 'comments',
+                'created_at', 'updated_at',
+            )[:5]
+        ]
+
+        # Attendance totals arrive annotated on the get_object query
+        # (see get_queryset), so no separate aggregate runs here.
+        total_attendance = employee.total_attendance
+        present_days = employee.present_attendance
         attendance_rate = (present_days / total_attendance * 100) if total_attendance > 0 else 0
         
         profile_data = {
             'employee': self.get_serializer(employee).data,
-            'recent_performances': PerformanceSerializer(recent_performances, many=True).data,
+            'recent_performances': recent_performances,
             'attendance_stats': {
                 'total_days': total_attendance,
                 'present_days': present_days,
@@ -145,120 +241,110 @@ class EmployeeViewSet(viewsets.ModelViewSet):
 
 class PerformanceViewSet(viewsets.ModelViewSet):
     """Performance review management ViewSet with filtering capabilities."""
-    queryset = Performance.objects.select_related('employee').all()
+    # The concatenated name is computed in SQL, so no Employee row is
+    # joined into memory per review just to render employee_name.
+    queryset = Performance.objects.annotate(
+        employee_full_name=Concat('employee__first_name', Value(' '), 'employee__last_name')
+    )
     serializer_class = PerformanceSerializer
     permission_classes = [IsAuthenticated]  # 暂时简化权限
     
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['employee', 'rating', 'employee__department']
+    filter_backends = [LazyDjangoFilterBackend, SearchFilter, OrderingFilter]
+    filterset_class = PerformanceFilter
     search_fields = ['employee__first_name', 'employee__last_name', 'reviewer']
     ordering_fields = ['review_date', 'rating']
     ordering = ['-review_date']
 
-    def get_queryset(self):
-        """Returns filtered queryset supporting review date range filtering.
-        
-        Query Parameters:
-            date_from: Filter reviews on or after this date
-            date_to: Filter reviews on or before this date
-        """
-        queryset = Performance.objects.select_related('employee').all()
-        
-        date_from = self.request.query_params.get('date_from')
-        date_to = self.request.query_params.get('date_to')
-        
-        if date_from:
-            queryset = queryset.filter(review_date__gte=date_from)
-        if date_to:
-            queryset = queryset.filter(review_date__lte=date_to)
-            
-        return queryset
-
 class EmployeeAnalyticsView(APIView):
     """Employee analytics API providing statistical insights."""
-    
+
     def get(self, request):
         """Returns comprehensive employee analytics data.
-        
+
         Includes:
         - Employee count statistics
         - Department distribution
         - Employment status breakdown
         - Salary analytics by department
         - Performance review summary
-        
+
         Returns:
             Response containing analytics data
         """
-        # Basic statistics
-        total_employees = Employee.objects.count()
-        active_employees = Employee.objects.filter(is_active=True).count()
-        
-        # Employees by department
-        employees_by_dept = Employee.objects.filter(is_active=True).values(
-            'department__name'
-        ).annotate(count=Count('id')).order_by('-count')
-        
+        # Dashboards poll this endpoint; a short-TTL cache keeps the
+        # full-table aggregates off the hot path. Writes to Employee or
+        # Performance drop the key via signals (employees/signals.py).
+        cached = cache.get(ANALYTICS_CACHE_KEY)
+        if cached is not None:
+            return Response(cached)
+
+        # Fused aggregates: total/active in one scan, count and average
+        # salary per department in one grouped query, and both performance
+        # figures in one aggregate — three queries instead of six.
+        totals = Employee.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True)),
+        )
+
         # Employment status distribution
         status_distribution = Employee.objects.values(
             'employment_status'
         ).annotate(count=Count('id')).order_by('-count')
-        
-        # Average salary by department
-        salary_by_dept = Employee.objects.filter(is_active=True).values(
-            'department__name'
-        ).annotate(avg_salary=Avg('salary')).order_by('-avg_salary')
-        
+
+        # Per-department count and average salary from a single grouped scan,
+        # re-sorted client-side for the two response sections.
+        dept_stats = list(
+            Employee.objects.filter(is_active=True).values(
+                'department__name'
+            ).annotate(count=Count('id'), avg_salary=Avg('salary'))
+        )
+
         # Performance overview
-        total_reviews = Performance.objects.count()
-        average_rating = Performance.objects.aggregate(avg_rating=Avg('rating'))['avg_rating'] or 0
-        
+        performance = Performance.objects.aggregate(total=Count('id'), avg=Avg('rating'))
+
         analytics_data = {
-            'total_employees': total_employees,
-            'active_employees': active_employees,
-            'inactive_employees': total_employees - active_employees,
-            'employees_by_department': list(employees_by_dept),
+            'total_employees': totals['total'],
+            'active_employees': totals['active'],
+            'inactive_employees': totals['total'] - totals['active'],
+            'employees_by_department': [
+                {'department__name': item['department__name'], 'count': item['count']}
+                for item in sorted(dept_stats, key=lambda item: item['count'], reverse=True)
+            ],
             'employment_status_distribution': list(status_distribution),
             'salary_by_department': [
                 {
                     'department': item['department__name'],
                     'avg_salary': round(float(item['avg_salary']), 2)
                 }
-                for item in salary_by_dept
+                for item in sorted(dept_stats, key=lambda item: item['avg_salary'], reverse=True)
             ],
             'performance_summary': {
-                'total_reviews': total_reviews,
-                'average_rating': round(float(average_rating), 2)
+                'total_reviews': performance['total'],
+                'average_rating': round(float(performance['avg'] or 0), 2)
             }
         }
-        
+
+        cache.set(ANALYTICS_CACHE_KEY, analytics_data, 60)
         return Response(analytics_data)
     
-from django.shortcuts import render
+from django.views.generic import TemplateView
 
-class DashboardView(APIView):
+# Plain TemplateViews: these pages are static shells that fetch their data
+# client-side, so DRF's per-request machinery (content negotiation,
+# authentication, throttling) bought nothing here.
+
+class DashboardView(TemplateView):
     """Dashboard view rendering the analytics visualization page."""
-    
-    def get(self, request):
-        """Renders the dashboard HTML template."""
-        return render(request, 'dashboard.html')
-    
-from django.shortcuts import render
+    template_name = 'dashboard.html'
 
-class EmployeeListView(APIView):
+class EmployeeListView(TemplateView):
     """Employee list view with Django template."""
-    
-    def get(self, request):
-        return render(request, 'employee_list.html')
+    template_name = 'employee_list.html'
 
-class DepartmentListView(APIView):
+class DepartmentListView(TemplateView):
     """Department list view with Django template."""
-    
-    def get(self, request):
-        return render(request, 'department_list.html')
+    template_name = 'department_list.html'
 
-class AttendanceListView(APIView):
+class AttendanceListView(TemplateView):
     """Attendance list view with Django template."""
-    
-    def get(self, request):
-        return render(request, 'attendance_list.html')
\ No newline at end of file
+    template_name = 'attendance_list.html'
\ No newline at end of file